@@ -1,16 +1,26 @@
 import re
-from typing import List, Tuple, Set
-import nltk
-from nltk.tokenize import regexp_tokenize
+from sys import intern
+from typing import List, Set, Tuple, Union
+import numpy as np
 from collections import Counter
 import math
 
-# Ensure you have the NLTK data required
-nltk.download('punkt')
+# Regular expression pattern for tokenization, compiled once at import time.
+# Groups are non-capturing so every match yields the whole token.
+_TOKEN_RE = re.compile(r'''(?x) # set flag to allow verbose regexps
+                         (?:[A-Z]\.)+          # abbreviations, e.g. U.S.A.
+                         | \w+(?:-\w+)*        # words with optional internal hyphens
+                         | \$?\d+(?:\.\d+)?%?  # currency and percentages, e.g. $12.40, 82%
+                         | \.\.\.              # ellipsis
+                         | [][.,;"'?():\-_‘]   # these are separate tokens; includes ], [
+                      ''', re.VERBOSE)
 
 def tokenize_text(text: str) -> List[str]:
     """
-    Tokenizes input text using a regular expression pattern with NLTK's regexp_tokenize.
+    Tokenizes input text using a precompiled regular expression pattern.
+
+    Tokens are interned, so repeated words share a single string object in the returned list
+    and in any vocabulary or frequency counts built from it.
 
     Args:
     text (str): The text you want to tokenize.
@@ -18,17 +28,7 @@ def tokenize_text(text: str) -> List[str]:
     Returns:
     List[str]: A list of tokens extracted from the text.
     """
-    # Regular expression pattern for tokenization
-    pattern = r'''(?x) # set flag to allow verbose regexps
-                   ([A-Z]\.)+         # abbreviations, e.g. U.S.A.
-                   | \w+(-\w+)*       # words with optional internal hyphens
-                   | \$?\d+(\.\d+)?%? # currency and percentages, e.g. $12.40, 82%
-                   | \.\.\.           # ellipsis
-                   | [][.,;"'?():-_‘] # these are separate tokens; includes ], [
-                '''
-
-    tokens = regexp_tokenize(text, pattern)
-    return tokens
+    return [intern(token) for token in _TOKEN_RE.findall(text)]
 
 def compute_vocabulary(tokens: List[str]) -> Tuple[int, Set[str]]:
     """
@@ -43,19 +43,22 @@ def compute_vocabulary(tokens: List[str]) -> Tuple[int, Set[str]]:
     vocabulary_set = set(tokens)
     return len(vocabulary_set), vocabulary_set
 
-def heaps_law_estimation(num_tokens: int, beta: float = 0.7, k: float = 10.0) -> float:
+def heaps_law_estimation(num_tokens: Union[int, np.ndarray], beta: float = 0.7,
+                         k: float = 10.0) -> Union[float, np.ndarray]:
     """
     Applies Heap's Law to estimate vocabulary size based on the number of tokens.
 
+    Works element-wise on arrays, so a whole range of corpus sizes can be evaluated in one call.
+
     Args:
-    num_tokens (int): Number of tokens in the text corpus.
+    num_tokens (Union[int, np.ndarray]): Number of tokens in the text corpus, or an array of such counts.
     beta (float): Constant characterizing the growth rate of vocabulary with the number of tokens.
     k (float): Constant scaling factor.
 
     Returns:
-    float: Estimated vocabulary size according to Heap's Law.
+    Union[float, np.ndarray]: Estimated vocabulary size(s) according to Heap's Law.
     """
-    estimated_vocab_size = k * (num_tokens ** beta)
+    estimated_vocab_size = k * np.power(np.asarray(num_tokens, dtype=np.float64), beta)
     return estimated_vocab_size
 
 def text_analysis_pipeline(text: str) -> None:
@@ -75,7 +78,7 @@ def text_analysis_pipeline(text: str) -> None:
     # Tokenization
     tokens = tokenize_text(text)
     num_tokens = len(tokens)
-    
+
     # Compute Vocabulary
     vocab_size, vocabulary = compute_vocabulary(tokens)
 
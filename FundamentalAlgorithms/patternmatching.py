@@ -79,34 +79,46 @@ def reflect(fragment: str) -> str:
     tokens = fragment.lower().split()
     return ' '.join(reflections.get(token, token) for token in tokens)
 
-patterns: List[Tuple[Pattern[str], Callable[[re.Match], str]]] = [
-    (re.compile(r'I need (.+)', re.IGNORECASE),
-     lambda match: f"Why do you need {reflect(match.group(1))}?"),
-    (re.compile(r'Why don\'t you (.+)\??', re.IGNORECASE),
-     lambda match: f"Do you really think I don't {reflect(match.group(1))}?"),
-    (re.compile(r'Why can\'t I (.+)\??', re.IGNORECASE),
-     lambda match: f"Maybe you could {reflect(match.group(1))} if you tried."),
-    (re.compile(r'I can\'t (.+)', re.IGNORECASE),
-     lambda match: f"What makes you think you can't {reflect(match.group(1))}?"),
-    (re.compile(r'I am (.+)', re.IGNORECASE),
-     lambda match: f"How long have you been {reflect(match.group(1))}?"),
-    (re.compile(r'I\'m (.+)', re.IGNORECASE),
-     lambda match: f"Why are you {reflect(match.group(1))}?"),
-    (re.compile(r'I feel (.+)', re.IGNORECASE),
-     lambda match: f"Tell me more about feeling {reflect(match.group(1))}."),
-    (re.compile(r'(.*)', re.IGNORECASE),
-     lambda match: "Please tell me more.")
+# Each rule source contains exactly one capturing group: the fragment handed to its response function.
+patterns: List[Tuple[str, Callable[[str], str]]] = [
+    (r'I need (.+)',
+     lambda fragment: f"Why do you need {reflect(fragment)}?"),
+    (r'Why don\'t you (.+)\??',
+     lambda fragment: f"Do you really think I don't {reflect(fragment)}?"),
+    (r'Why can\'t I (.+)\??',
+     lambda fragment: f"Maybe you could {reflect(fragment)} if you tried."),
+    (r'I can\'t (.+)',
+     lambda fragment: f"What makes you think you can't {reflect(fragment)}?"),
+    (r'I am (.+)',
+     lambda fragment: f"How long have you been {reflect(fragment)}?"),
+    (r'I\'m (.+)',
+     lambda fragment: f"Why are you {reflect(fragment)}?"),
+    (r'I feel (.+)',
+     lambda fragment: f"Tell me more about feeling {reflect(fragment)}.")
 ]
 
+# Dispatch below relies on that single group, so check it when the module loads.
+if any(re.compile(source).groups != 1 for source, _ in patterns):
+    raise ValueError("Each ELIZA rule must contain exactly one capturing group.")
+
+# All rules compiled into a single alternation so each input is scanned by one match call.
+# Alternatives are tried in order, so the first rule that matches still wins. The \A...\Z
+# anchors are part of the pattern itself, and ASCII keeps case folding on the fast ASCII path.
+eliza_scanner: Pattern[str] = re.compile(
+    r'\A(?:' + '|'.join(f'(?P<p{index}>{source})' for index, (source, _) in enumerate(patterns)) + r')\Z',
+    re.IGNORECASE | re.ASCII
+)
+
 def get_eliza_response(user_input: str) -> str:
     """
     Generates a response based on the user's input using predefined patterns.
     """
-    for pattern, response_function in patterns:
-        match = pattern.fullmatch(user_input.strip())
-        if match:
-            return response_function(match)
-    return "I'm not sure I understand. Can you elaborate?"
+    match = eliza_scanner.match(user_input.strip())
+    if match:
+        # The rule's own group directly follows its named outer group.
+        response_function = patterns[int(match.lastgroup[1:])][1]
+        return response_function(match.group(match.lastindex + 1))
+    return "Please tell me more."
 
 def eliza_chatbot():
     """
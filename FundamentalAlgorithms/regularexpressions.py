@@ -13,6 +13,18 @@ strings, underlining the need for raw string notation with examples.
 import re  # For working with regular expressions in Python
 from typing import List, Tuple, Optional
 
+# Patterns and lookup sets used by the examples below, built once at import time.
+_THE_RE = re.compile(r'\b[tT]he\b')
+_ROUGH_THE_RE = re.compile(r'[tT]he')
+_ANIMAL_RE = re.compile(r'\b(?:cat|dog|rabbit)\b')
+_WORD_RE = re.compile(r'\b\w+\b')
+_EXCLUDED_ANIMALS = frozenset(("cat", "dog", "rabbit"))
+_DIGITS_RE = re.compile(r'\d+')  # Alias for digits
+_WORDS_RE = re.compile(r'\w+')   # Alias for word characters (alphanumeric + underscore)
+_SPACES_RE = re.compile(r'\s+')  # Alias for space characters (spaces, tabs, newlines)
+_WILDCARD_RE = re.compile(r'a[n]?\w*')  # Matches 'a', 'an', 'any', etc.
+_THE_SENTENCE_RE = re.compile(r'^The.*\.$', re.MULTILINE)  # MULTILINE to handle line-by-line matching
+
 
 def find_word_the(text: str) -> List[str]:
     """
@@ -32,9 +44,7 @@ def find_word_the(text: str) -> List[str]:
 
     example pattern: r'\b[tT]he\b'
     """
-    pattern = r'\b[tT]he\b'
-    matches = re.findall(pattern, text)
-    return matches
+    return _THE_RE.findall(text)
 
 
 def regex_disjunction(text: str) -> List[str]:
@@ -48,8 +58,7 @@ def regex_disjunction(text: str) -> List[str]:
     Returns:
         List of matched strings: 'cat', 'dog', or 'rabbit'.
     """
-    pattern = r'\b(cat|dog|rabbit)\b'
-    return re.findall(pattern, text)
+    return _ANIMAL_RE.findall(text)
 
 
 def regex_with_negation_disjunction(text: str) -> List[str]:
@@ -63,8 +72,7 @@ def regex_with_negation_disjunction(text: str) -> List[str]:
         List of words excluding 'cat', 'dog', and 'rabbit'.
     """
     # We'll split the text into words and then filter out 'cat', 'dog', and 'rabbit'
-    words = re.findall(r'\b\w+\b', text)
-    return [word for word in words if word not in {"cat", "dog", "rabbit"}]
+    return [word for word in _WORD_RE.findall(text) if word not in _EXCLUDED_ANIMALS]
 
 
 def convenient_aliases_examples(text: str) -> List[str]:
@@ -78,13 +86,9 @@ def convenient_aliases_examples(text: str) -> List[str]:
     Returns:
         List of matched strings for digit sequences, word sequences, and whitespace.
     """
-    digit_pattern = r'\d+'  # Alias for digits
-    word_pattern = r'\w+'   # Alias for word characters (alphanumeric + underscore)
-    space_pattern = r'\s+'  # Alias for space characters (spaces, tabs, newlines)
-
-    digits = re.findall(digit_pattern, text)
-    words = re.findall(word_pattern, text)
-    spaces = re.findall(space_pattern, text)
+    digits = _DIGITS_RE.findall(text)
+    words = _WORDS_RE.findall(text)
+    spaces = _SPACES_RE.findall(text)
 
     return {
         'digits': digits,
@@ -110,8 +114,7 @@ def advanced_regex_wildcards(text: str) -> List[str]:
     Returns:
         List of matched examples based on wildcards and repetition patterns.
     """
-    pattern = r'a[n]?\w*'  # Matches 'a', 'an', 'any', etc.
-    return re.findall(pattern, text)
+    return _WILDCARD_RE.findall(text)
 
 
 def regex_anchors_examples(text: str) -> List[str]:
@@ -125,8 +128,7 @@ def regex_anchors_examples(text: str) -> List[str]:
     Returns:
         List of sentences that match the anchored pattern.
     """
-    pattern = r'^The.*\.$'  # Sentences starting with "The" and ending with period
-    return re.findall(pattern, text, re.MULTILINE)  # MULTILINE to handle line-by-line matching
+    return _THE_SENTENCE_RE.findall(text)  # Sentences starting with "The" and ending with period
 
 
 def iterative_regex_process_example(text: str) -> Tuple[List[str], List[str]]:
@@ -143,15 +145,22 @@ def iterative_regex_process_example(text: str) -> Tuple[List[str], List[str]]:
         - List of valid matches ('the' or 'The').
         - List of invalid matches (e.g., 'there', 'then', 'other').
     """
-    # Initial attempt: 
-    rough_pattern = r'[tT]he'                          # Matches too much, not filtered for boundaries
-    valid_pattern = r'\b[tT]he\b'                      # Correct usage with boundaries to avoid substrings
-
-    # Valid matches
-    valid_matches = re.findall(valid_pattern, text)
+    # Initial attempt: r'[tT]he' matches too much, not filtered for boundaries.
+    # Refinement: r'\b[tT]he\b' adds boundaries to avoid substrings. Both are evaluated in one
+    # scan with the rough pattern, checking the word boundaries around each hit by hand.
+    valid_matches = []
+    rough_only = set()
+    for match in _ROUGH_THE_RE.finditer(text):
+        start, end = match.span()
+        before_ok = start == 0 or not (text[start - 1].isalnum() or text[start - 1] == '_')
+        after_ok = end == len(text) or not (text[end].isalnum() or text[end] == '_')
+        if before_ok and after_ok:
+            valid_matches.append(match.group())
+        else:
+            rough_only.add(match.group())
 
     # Invalid matches from the rough pattern
-    invalid_matches = list(set(re.findall(rough_pattern, text)) - set(valid_matches))
+    invalid_matches = list(rough_only.difference(valid_matches))
 
     return valid_matches, invalid_matches
 
@@ -14,7 +14,7 @@ Date: November 2024
 """
 
 import re
-from typing import List, Pattern, Tuple
+from typing import Iterator, List, Pattern, Tuple
 
 # =============================================================================
 # Regular Expressions are used everywhere
@@ -53,6 +53,31 @@ matches = find_all_matches(pattern, sample_text)
 print(f"Matches for pattern '{pattern}': {matches}")
 # Output: Matches for pattern '[Tt]he': ['The', 'the', 'Then', 'the']
 
+def iter_matches(pattern: str, text: str) -> Iterator[str]:
+    """
+    Lazily yield the substrings in 'text' that match the given 'pattern'.
+
+    Unlike find_all_matches, no result list is built, which keeps memory flat on
+    large inputs when the matches only need to be iterated or counted.
+
+    Args:
+        pattern (str): The regex pattern to search for.
+        text (str): The text to search within.
+
+    Returns:
+        Iterator[str]: An iterator over the matching substrings.
+    """
+    try:
+        compiled_pattern: Pattern = re.compile(pattern)
+    except re.error as regex_error:
+        raise ValueError(f"Invalid regex pattern: {pattern}") from regex_error
+    return (match.group(0) for match in compiled_pattern.finditer(text))
+
+# Example Usage:
+match_count = sum(1 for _ in iter_matches(pattern, sample_text))
+print(f"Number of matches for pattern '{pattern}': {match_count}")
+# Output: Number of matches for pattern '[Tt]he': 4
+
 # =============================================================================
 # Disjunctions
 # =============================================================================